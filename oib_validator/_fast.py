@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Optional Numba-compiled kernels for OIB validation.
+
+These kernels run the ISO 7064, MOD 11-10 algorithm on arrays of digit values
+(not ASCII characters) and are compiled to native code by Numba. Numba is an
+optional dependency; when it is not installed HAVE_NUMBA is False and none of
+the kernels are defined, so callers must check the flag first.
+"""
+from functools import lru_cache
+from typing import Any, Callable
+
+try:
+    import numpy as np
+    from numba import literal_unroll, njit, prange
+except ImportError:  # pragma: no cover - Numba is an optional speed-up
+    njit = None  # type: ignore[assignment]
+
+HAVE_NUMBA: bool = njit is not None
+
+# Minimum number of rows for which check_rows_parallel() is worth the cost of
+# dispatching work to Numba's thread pool
+PARALLEL_MIN_ROWS: int = 65536
+
+# A kernel specialized for one batch size takes roughly half a second to
+# compile, so it is only built for reasonably large batches, once the same
+# size has been seen this many times in a row (e.g. an ETL job validating
+# fixed-size chunks)
+FIXED_MIN_ROWS: int = 1024
+FIXED_AFTER_REPEATS: int = 16
+
+# Row count of the previous batch and how many times in a row it was seen
+_last_rows: int = -1
+_repeats: int = 0
+
+
+if HAVE_NUMBA:
+
+    # Check digit for every final control value (only 1..10 occur, index 0 is
+    # padding): 11 minus the control value, with 10 mapped to 0. Numba freezes
+    # global arrays into the compiled code, so the lookup replaces the last
+    # branch in the kernels
+    _FINAL = np.array([0, 0, 9, 8, 7, 6, 5, 4, 3, 2, 1], dtype=np.uint8)
+
+    @njit("boolean(uint8[:])", cache=True, boundscheck=False)
+    def check_digits(digits):  # type: ignore[no-untyped-def]
+        """
+        Validates the 11 digit values of a single OIB.
+
+        Args:
+            digits: Array of 11 digit values in the range 0..9.
+
+        Returns:
+            bool: True if the check digit matches, False otherwise.
+        """
+        control_value = 10
+        for i in range(10):
+            # (control_value + digit) % 10 with 0 mapped to 10, without a branch
+            control_value = (control_value - 1 + digits[i]) % 10 + 1
+            # (2 * control_value) % 11 for 2..20, without a division
+            doubled = control_value << 1
+            control_value = doubled - 11 * (doubled >= 11)
+        return _FINAL[control_value] == digits[10]
+
+    @njit("boolean[:](uint8[:, :])", cache=True, boundscheck=False)
+    def check_rows(matrix):  # type: ignore[no-untyped-def]
+        """
+        Validates every row of an (N, 11) matrix of digit values.
+
+        Args:
+            matrix: Array with one OIB per row, as digit values in the range 0..9.
+
+        Returns:
+            numpy.ndarray: Boolean array with the result for each row.
+        """
+        result = np.empty(matrix.shape[0], dtype=np.bool_)
+        for row in range(matrix.shape[0]):
+            result[row] = check_digits(matrix[row])
+        return result
+
+    @njit("boolean[:](uint8[:, :])", parallel=True, cache=True, boundscheck=False)
+    def check_rows_parallel(matrix):  # type: ignore[no-untyped-def]
+        """
+        Validates every row of an (N, 11) matrix of digit values on all cores.
+
+        Rows are independent, so they are split across Numba's thread pool with
+        prange. Same result as check_rows(), which is cheaper for small batches.
+
+        Args:
+            matrix: Array with one OIB per row, as digit values in the range 0..9.
+
+        Returns:
+            numpy.ndarray: Boolean array with the result for each row.
+        """
+        result = np.empty(matrix.shape[0], dtype=np.bool_)
+        for row in prange(matrix.shape[0]):
+            result[row] = check_digits(matrix[row])
+        return result
+
+    @lru_cache(maxsize=4)
+    def compile_fixed_kernel(n_rows: int) -> Callable[[Any], Any]:
+        """
+        Compiles a check_rows() variant specialized for exactly n_rows rows.
+
+        The row count is baked in as a constant and the 10 steps of the state
+        machine are inlined with literal_unroll, which lets LLVM drop the loop
+        bookkeeping and vectorize across rows. Only the last few sizes are
+        kept, to bound the memory and compile time spent on variants.
+
+        Args:
+            n_rows: The exact number of rows the kernel will be called with.
+
+        Returns:
+            Callable: Compiled kernel taking an (n_rows, 11) uint8 digit matrix
+                and returning a boolean array.
+        """
+        steps = tuple(range(10))
+
+        @njit("boolean[:](uint8[:, :])", boundscheck=False)
+        def check_rows_fixed(matrix):  # type: ignore[no-untyped-def]
+            result = np.empty(n_rows, dtype=np.bool_)
+            for row in range(n_rows):
+                control_value = 10
+                for i in literal_unroll(steps):
+                    control_value = (control_value - 1 + matrix[row, i]) % 10 + 1
+                    doubled = control_value << 1
+                    control_value = doubled - 11 * (doubled >= 11)
+                result[row] = _FINAL[control_value] == matrix[row, 10]
+            return result
+
+        return check_rows_fixed
+
+    def check_matrix(matrix: Any) -> Any:
+        """
+        Validates every row of an (N, 11) digit matrix with the best kernel.
+
+        - check_rows_parallel() for batches of PARALLEL_MIN_ROWS rows or more
+        - a kernel from compile_fixed_kernel() once the same batch size has
+          been seen FIXED_AFTER_REPEATS times in a row
+        - check_rows() otherwise
+
+        Args:
+            matrix: Array with one OIB per row, as digit values in the range 0..9.
+
+        Returns:
+            numpy.ndarray: Boolean array with the result for each row.
+        """
+        global _last_rows, _repeats
+
+        n_rows = matrix.shape[0]
+        _repeats = _repeats + 1 if n_rows == _last_rows else 1
+        _last_rows = n_rows
+
+        if n_rows >= PARALLEL_MIN_ROWS:
+            return check_rows_parallel(matrix)
+        if n_rows >= FIXED_MIN_ROWS and _repeats >= FIXED_AFTER_REPEATS:
+            return compile_fixed_kernel(n_rows)(matrix)
+        return check_rows(matrix)
@@ -0,0 +1,4 @@
+# Type stub for the optional C accelerator built from _oibfast.c
+from typing import Union
+
+def validate_many(buffer: Union[bytes, bytearray, memoryview], stride: int, count: int) -> bytes: ...
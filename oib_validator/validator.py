@@ -9,10 +9,338 @@ assigned to each Croatian citizen and resident. The number consists of 10 random
 generated digits plus a final check digit that is calculated using the ISO 7064, MOD 11-10
 algorithm.
 """
-from typing import Union, Dict, List, Optional, TypeVar, Callable, Any
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Union, Dict, List, Optional, TypeVar, Callable, Any, Iterable, TextIO, Tuple, Type, cast
 
-# Create a type variable for the OIB type - can be str or int
-OibType = TypeVar('OibType', str, int)
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy is an optional speed-up
+    np = None  # type: ignore[assignment]
+
+try:
+    from . import _oibfast
+except ImportError:  # pragma: no cover - the C extension is built optionally
+    _oibfast = None  # type: ignore[assignment]
+
+# Create a type variable for the OIB type - can be str, int or raw ASCII bytes
+OibType = TypeVar('OibType', str, int, bytes, bytearray, memoryview)
+
+# Binary types accepted as OIBs without decoding
+_BYTES_TYPES = (bytes, bytearray, memoryview)
+
+
+def _build_transition_table() -> bytes:
+    """
+    Precomputes the ISO 7064, MOD 11-10 state transitions.
+    
+    Between steps the control value is always in the range 1..10, so it is stored
+    as a state index 0..9 (control value - 1). The entry at ``state * 10 + digit``
+    holds the state reached after feeding ``digit`` into ``state``.
+    
+    Returns:
+        bytes: The 100-entry transition table.
+    """
+    table = bytearray(100)
+    for state in range(10):
+        for digit in range(10):
+            # Steps 1-3: Add the current digit, take the result modulo 10 and map
+            # 0 to 10. Shifting the range down by one does this in one modulo:
+            # ((control_value - 1 + digit) % 10) + 1, where state is already
+            # control_value - 1
+            control_value = (state + digit) % 10 + 1
+            
+            # Steps 4-5: Multiply by 2 and take the result modulo 11. The product
+            # is in 2..20, so the modulo is at most one subtraction of 11
+            doubled = control_value << 1
+            control_value = doubled - 11 * (doubled >= 11)
+            
+            table[state * 10 + digit] = control_value - 1
+    return bytes(table)
+
+
+# State index of the initial control value 10
+_INITIAL_STATE: int = 9
+
+# Next state for every (state, digit) pair, indexed by state * 10 + digit
+_NEXT: bytes = _build_transition_table()
+
+# The same table shifted by ord('0'), so it can be indexed directly with the
+# ASCII code of a digit: state * 10 + byte
+_NEXT_ASCII: bytes = bytes(48) + _NEXT
+
+# Expected check digit for every final state: 11 - control value, where a
+# result of 10 becomes 0 (special case in the algorithm)
+_CHECK_FROM_STATE: bytes = bytes(
+    0 if 11 - control_value == 10 else 11 - control_value
+    for control_value in range(1, 11)
+)
+
+# The same check digits as ASCII codes, for comparing directly with a byte
+_CHECK_ASCII_FROM_STATE: bytes = bytes(48 + digit for digit in _CHECK_FROM_STATE)
+
+# Range of integers with exactly 11 decimal digits
+_MIN_INT_OIB: int = 10 ** 10
+_MAX_INT_OIB: int = 10 ** 11
+
+# NumPy views of the same tables for the vectorized bulk path
+if np is not None:
+    _NEXT_NP = np.frombuffer(_NEXT, dtype=np.uint8)
+    _CHECK_FROM_STATE_NP = np.frombuffer(_CHECK_FROM_STATE, dtype=np.uint8)
+
+
+def _checksum_matches(oib: bytes) -> bool:
+    """
+    Runs the ISO 7064, MOD 11-10 algorithm on an already validated OIB.
+    
+    Args:
+        oib: Exactly 11 ASCII digit bytes.
+    
+    Returns:
+        bool: True if the calculated check digit matches the 11th digit.
+    """
+    # Start with control value 10 and feed the first 10 digits through the
+    # precomputed transition table. Indexing bytes yields the ASCII codes as ints
+    # directly, and the ASCII-indexed table absorbs the '0' offset, so each step
+    # is a single lookup with no per-digit int() call or subtraction
+    state: int = _INITIAL_STATE
+    for char in oib[:10]:
+        state = _NEXT_ASCII[state * 10 + char]
+    
+    # The OIB is valid if the calculated check digit matches the 11th digit,
+    # compared as ASCII codes so no conversion is needed
+    return _CHECK_ASCII_FROM_STATE[state] == oib[10]
+
+
+@lru_cache(maxsize=65536)
+def _check_str(oib: str) -> bool:
+    """
+    Cached checksum validation for an 11-character ASCII digit string.
+    
+    Batch pipelines tend to validate the same OIBs over and over, so results
+    are memoized per string and repeat lookups skip the algorithm entirely.
+    
+    Args:
+        oib: Exactly 11 ASCII digits.
+    
+    Returns:
+        bool: True if the calculated check digit matches the 11th digit.
+    """
+    return _checksum_matches(oib.encode("ascii"))
+
+
+# Minimum number of rows for which the C extension's work is split across
+# threads (it releases the GIL), matching _fast.PARALLEL_MIN_ROWS for Numba
+_PARALLEL_MIN_ROWS: int = 65536
+
+
+def _available_cpus() -> int:
+    """Returns the number of CPUs this process is allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def _validate_buffer_c(buffer: bytes, count: int) -> bytes:
+    """
+    Validates OIBs packed back to back in a buffer with the C extension.
+    
+    The extension releases the GIL while it runs, so batches of
+    _PARALLEL_MIN_ROWS rows or more are split into one contiguous chunk per
+    available CPU and validated on a thread pool.
+    
+    Args:
+        buffer: Concatenated 11-byte OIBs (any bytes; non-digits are rejected).
+        count: Number of OIBs in the buffer.
+    
+    Returns:
+        bytes: One byte per OIB, 1 if valid and 0 otherwise.
+    """
+    length = OibValidator.LENGTH
+    workers = min(_available_cpus(), count // _PARALLEL_MIN_ROWS + 1)
+    if count < _PARALLEL_MIN_ROWS or workers < 2:
+        return _oibfast.validate_many(buffer, length, count)
+    
+    # Slices of a memoryview share the buffer, so no rows are copied
+    view = memoryview(buffer)
+    chunk = -(-count // workers)
+    starts = range(0, count, chunk)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        flags = executor.map(
+            lambda start: _oibfast.validate_many(
+                view[start * length:(start + chunk) * length], length, min(chunk, count - start)
+            ),
+            starts,
+        )
+        return b"".join(flags)
+
+
+def _validate_buffer(buffer: bytes, count: int) -> List[bool]:
+    """
+    Validates OIBs packed back to back in a buffer with the fastest backend.
+    
+    Uses the C extension when it was built, NumPy (and Numba, if installed)
+    otherwise. At least one of them must be available.
+    
+    Args:
+        buffer: Concatenated 11-byte OIBs (any bytes; non-digits are rejected).
+        count: Number of OIBs in the buffer.
+    
+    Returns:
+        List[bool]: The validation result for each 11-byte row.
+    """
+    if _oibfast is not None:
+        return list(map(bool, _validate_buffer_c(buffer, count)))
+    return _validate_buffer_numpy(buffer)
+
+
+def _validate_buffer_numpy(buffer: bytes) -> List[bool]:
+    """
+    Validates OIBs packed back to back in a buffer using NumPy.
+    
+    Args:
+        buffer: Concatenated 11-byte OIBs (any bytes; non-digits are rejected).
+    
+    Returns:
+        List[bool]: The validation result for each 11-byte row.
+    """
+    # Subtracting '0' wraps non-digit bytes to values >= 10 (uint8 arithmetic)
+    digits = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, OibValidator.LENGTH) - 48
+    
+    # A single max() over the whole contiguous buffer clears the common case of
+    # all-digit input; the much slower per-row reduction only runs otherwise
+    is_numeric: np.ndarray
+    if digits.max() < 10:
+        is_numeric = np.ones(len(digits), dtype=bool)
+    else:
+        is_numeric = np.all(digits < 10, axis=1)
+        
+        # Zero out rejected rows so they can't index outside the table
+        digits[~is_numeric] = 0
+    
+    # Numba is imported lazily so plain check() users don't pay for it
+    from . import _fast
+    
+    if _fast.HAVE_NUMBA:
+        # Compiled kernel: runs the state machine natively, spreading the rows
+        # over all cores or specializing for the batch size where it pays off
+        valid = _fast.check_matrix(digits) & is_numeric
+    else:
+        # ====== ISO 7064, MOD 11-10 Checksum Algorithm (vectorized) ======
+        
+        # Transpose to an (11, N) layout so each step streams one contiguous
+        # column of digits instead of reading every 11th byte
+        columns = np.ascontiguousarray(digits.T)
+        
+        # Each step computes the flat table index state * 10 + digit in place
+        # (at most 99, so uint8 is enough) and gathers the next state with
+        # take(), reusing the same two buffers for all 10 steps
+        state = np.full(len(digits), _INITIAL_STATE, dtype=np.uint8)
+        index = np.empty_like(state)
+        for i in range(10):
+            np.multiply(state, 10, out=index)
+            index += columns[i]
+            _NEXT_NP.take(index, out=state)
+        valid = (_CHECK_FROM_STATE_NP[state] == columns[10]) & is_numeric
+    return cast(List[bool], valid.tolist())
+
+
+def _to_ascii(oib: Any) -> bytes:
+    """
+    Converts an OIB of any supported type to ASCII bytes for bulk validation.
+    
+    Binary input is taken as is; strings and integers are encoded with non-ASCII
+    characters replaced by '?', which keeps the length and fails the digit check.
+    
+    Args:
+        oib: The OIB as string, integer, bytes, bytearray or memoryview.
+    
+    Returns:
+        bytes: The OIB's characters as bytes.
+    """
+    if isinstance(oib, _BYTES_TYPES):
+        return bytes(oib)
+    return str(oib).encode("ascii", "replace")
+
+
+def _to_key(oib: Any) -> str:
+    """
+    Converts an OIB of any supported type to its string form.
+    
+    Binary input is decoded as ASCII (invalid bytes become U+FFFD) rather than
+    passed to str(), which would produce its repr, e.g. "b'12345678903'".
+    
+    Args:
+        oib: The OIB as string, integer, bytes, bytearray or memoryview.
+    
+    Returns:
+        str: The OIB as a string.
+    """
+    if isinstance(oib, _BYTES_TYPES):
+        return bytes(oib).decode("ascii", "replace")
+    return str(oib)
+
+
+# Bloom filter of a known set: the bit array, the number of hash functions k
+# and the size m in bits, a power of two. Kept in one tuple so that replacing
+# the filter is a single atomic assignment
+_KnownSet = Tuple[bytearray, int, int]
+
+
+def _bloom_positions(oib: str, k: int, m: int) -> List[int]:
+    """
+    Computes the Bloom filter bit positions of an OIB.
+    
+    The 64-bit hash() of the string (randomized per process, and cached on the
+    str object) is split into two halves that are combined into k positions by
+    double hashing: (h1 + i * h2) mod m. m is a power of two, so the modulo is a
+    mask. _in_bloom() inlines the same arithmetic to stop at the first clear bit.
+    
+    Args:
+        oib: The OIB as a string.
+        k: Number of positions (hash functions).
+        m: Size of the filter in bits, a power of two.
+    
+    Returns:
+        List[int]: The k bit positions.
+    """
+    mask = m - 1
+    h = hash(oib)
+    h1 = h & mask
+    h2 = (h >> 32) & mask | 1
+    return [(h1 + i * h2) & mask for i in range(k)]
+
+
+def _in_bloom(known_set: _KnownSet, oib: str) -> bool:
+    """
+    Probes a known set's Bloom filter.
+    
+    Uses the same positions as _bloom_positions(), computed one at a time so
+    that an unknown OIB is usually rejected after the first or second lookup.
+    
+    Args:
+        known_set: The filter built by OibValidator.with_known_set().
+        oib: The OIB as a string.
+    
+    Returns:
+        bool: False if the OIB is definitely not in the known set, True if it may be.
+    """
+    bloom, k, m = known_set
+    mask = m - 1
+    h = hash(oib)
+    position = h & mask
+    if not bloom[position >> 3] & 1 << (position & 7):
+        return False
+    step = (h >> 32) & mask | 1
+    for _ in range(k - 1):
+        position = (position + step) & mask
+        if not bloom[position >> 3] & 1 << (position & 7):
+            return False
+    return True
 
 
 class OibValidator:
@@ -27,9 +355,15 @@ class OibValidator:
     
     Attributes:
         LENGTH (int): The required length of a valid OIB (11 digits).
+        BULK_THRESHOLD (int): Minimum list size for which validate() and
+            validate_all() switch to the vectorized validate_many() path.
     """
     
     LENGTH: int = 11
+    BULK_THRESHOLD: int = 32
+    
+    # Bloom filter of the known set registered with with_known_set()
+    _known_set: Optional[_KnownSet] = None
     
     @classmethod
     def validate(cls, data: Union[OibType, List[OibType]]) -> Union[bool, Dict[str, bool]]:
@@ -37,11 +371,11 @@ class OibValidator:
         Validates a single OIB or a list of OIBs.
         
         This method serves as a facade that handles different input types:
-        - If given a single OIB (as string or int), it will validate just that OIB
+        - If given a single OIB (as string, int or bytes), it will validate just that OIB
         - If given a list of OIBs, it will validate each one and return results as a dictionary
         
         Args:
-            data: A single OIB as string or integer, or a list of OIBs
+            data: A single OIB as string, integer or bytes, or a list of OIBs
                  to validate.
         
         Returns:
@@ -51,11 +385,12 @@ class OibValidator:
         """
         # Handle list input - validate each OIB in the list
         if isinstance(data, list):
-            result: Dict[str, bool] = {}
-            for oib in data:
-                # Convert each OIB to string for use as dictionary key
-                result[str(oib)] = cls.check(oib)
-            return result
+            # Convert each OIB to string for use as dictionary key; the strings
+            # validate exactly like the original values
+            keys: List[str] = [_to_key(oib) for oib in data]
+            
+            # Build the dictionary in one go from the list-aligned results
+            return dict(zip(keys, cls.validate_all(keys)))
         
         # Handle single OIB input
         return cls.check(data)
@@ -67,53 +402,189 @@ class OibValidator:
         
         The validation process:
         1. Verify the input is a numeric string of exactly 11 digits
-        2. Calculate a control digit based on the first 10 digits
-        3. Compare the calculated control digit with the 11th digit of the OIB
+        2. If a known set is registered (see with_known_set()), reject OIBs
+           that are definitely not in it
+        3. Calculate a control digit based on the first 10 digits
+        4. Compare the calculated control digit with the 11th digit of the OIB
         
         Args:
-            data: The OIB to validate as string or integer.
+            data: The OIB to validate as string, integer, or ASCII bytes
+                (bytes, bytearray or memoryview).
             
         Returns:
             bool: True if the OIB is valid, False otherwise.
         """
-        # Convert to string if it's an integer to allow string operations
-        data_str: str = str(data)
-        
-        # Perform basic validation: must be all digits and exactly 11 characters
-        if data_str.isdigit() and len(data_str) == cls.LENGTH:
-            # ====== ISO 7064, MOD 11-10 Checksum Algorithm ======
-            
-            # Start with control value 10
-            control_value: int = 10
-            
-            # Process the first 10 digits
-            for i in range(10):
-                # Get the current digit
-                current_digit: int = int(data_str[i])
-                
-                # Step 1: Add the current digit to the control value
-                # Step 2: Take the result modulo 10 (keep only the last digit)
-                control_value = (control_value + current_digit) % 10
-                
-                # Step 3: If control value is 0, set it to 10 (special case)
-                if control_value == 0:
-                    control_value = 10
-                    
-                # Step 4: Multiply by 2
-                # Step 5: Take the result modulo 11
-                control_value = (control_value * 2) % 11
+        # Integers can't carry leading zeros, so only 11-digit values can be valid.
+        # Their decimal form is then guaranteed to be 11 ASCII digits, which makes
+        # the string checks below unnecessary
+        if isinstance(data, int):
+            if not _MIN_INT_OIB <= data < _MAX_INT_OIB:
+                return False
+            data_str: str = str(data)
+        elif isinstance(data, _BYTES_TYPES):
+            # Raw bytes (e.g. from a binary CSV reader) are validated without
+            # decoding; bytes.isdigit() only accepts ASCII digits
+            oib = bytes(data)
+            if not (len(oib) == cls.LENGTH and oib.isdigit()):
+                return False
+            known_set = cls._known_set
+            if known_set is not None and not _in_bloom(known_set, oib.decode("ascii")):
+                return False
+            return _checksum_matches(oib)
+        else:
+            data_str = data if isinstance(data, str) else str(data)
             
-            # Calculate the check digit:
-            # - Subtract the final control value from 11
-            # - If the result is 10, the check digit is 0 (special case in the algorithm)
-            # - Otherwise, the check digit is the result itself
-            check_digit: int = 0 if 11 - control_value == 10 else 11 - control_value
+            # Perform basic validation: must be all ASCII digits and exactly 11
+            # characters (isascii() only reads a flag, so the cheap tests run first)
+            if not (len(data_str) == cls.LENGTH and data_str.isascii() and data_str.isdigit()):
+                return False
+        
+        # With a known set registered, OIBs that are definitely not in it are
+        # rejected without running the algorithm
+        known_set = cls._known_set
+        if known_set is not None and not _in_bloom(known_set, data_str):
+            return False
+        
+        return _check_str(data_str)
+    
+    @classmethod
+    def validate_all(cls, data: List[OibType]) -> List[bool]:
+        """
+        Validates a list of OIBs, returning one result per input in the same order.
+        
+        Unlike validate(), which returns a dictionary keyed by OIB, the results
+        are a plain list aligned with the input, so duplicates are kept and no
+        hashing is involved. Lists of at least BULK_THRESHOLD OIBs are handed to
+        validate_many() in one call; shorter lists are checked one by one, which
+        is cheaper for a handful of OIBs and benefits from the check() cache.
+        
+        Args:
+            data: A list of OIBs as strings, integers or bytes.
+        
+        Returns:
+            List[bool]: The validation result for each OIB, aligned with the input.
+        """
+        if len(data) >= cls.BULK_THRESHOLD:
+            return cls.validate_many(data)
+        return [cls.check(oib) for oib in data]
+    
+    @classmethod
+    def with_known_set(
+        cls, oibs: Optional[Iterable[OibType]], false_positive_rate: float = 0.01
+    ) -> "Type[OibValidator]":
+        """
+        Restricts validation to a known set of OIBs, such as registered taxpayers.
+        
+        The OIBs are stored in a Bloom filter. Afterwards check(), validate() and
+        the bulk methods reject any OIB the filter proves is not in the set before
+        running the algorithm; OIBs that may be in the set are validated as usual.
+        A small fraction (false_positive_rate) of unknown OIBs with a correct check
+        digit can still pass. The filter is shared by the whole class.
+        
+        Args:
+            oibs: The known OIBs as strings, integers or bytes, or None to remove the
+                known set and go back to plain validation.
+            false_positive_rate: Target probability of an unknown OIB passing the
+                filter, between 0 and 1.
+        
+        Returns:
+            Type[OibValidator]: The class itself, to allow chained calls.
+        
+        Raises:
+            ValueError: If false_positive_rate is not between 0 and 1.
+        """
+        if oibs is None:
+            cls._known_set = None
+            return cls
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        
+        keys: List[str] = [_to_key(oib) for oib in oibs]
+        
+        # Standard Bloom filter sizing: m bits and k hash functions for n keys,
+        # with m rounded up to a power of two (which only lowers the false
+        # positive rate) so positions can be masked instead of divided
+        n = max(len(keys), 1)
+        m = max(8, math.ceil(-n * math.log(false_positive_rate) / math.log(2) ** 2))
+        m = 1 << (m - 1).bit_length()
+        k = max(1, round(m / n * math.log(2)))
+        
+        bloom = bytearray(m // 8)
+        for key in keys:
+            for position in _bloom_positions(key, k, m):
+                bloom[position >> 3] |= 1 << (position & 7)
+        cls._known_set = (bloom, k, m)
+        return cls
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """
+        Clears the cache of previously validated OIBs used by check().
+        
+        Long-lived services that validate an ever-changing stream of OIBs can
+        call this periodically to release the memory held by the cache.
+        
+        Returns:
+            None
+        """
+        _check_str.cache_clear()
+    
+    @classmethod
+    def validate_many(cls, data: List[OibType]) -> List[bool]:
+        """
+        Validates a list of OIBs, returning one result per input in the same order.
+        
+        All OIBs are packed into one contiguous buffer and validated in a single
+        call to the fastest available backend, rather than one Python-level
+        check() per OIB:
+        - the compiled C extension, when it was built at install time
+        - a Numba-compiled kernel, when NumPy and Numba are installed
+        - 10 vectorized NumPy lookups into the transition table
+        With none of these available this falls back to check() for each OIB.
+        
+        Args:
+            data: A list of OIBs as strings, integers or bytes.
+        
+        Returns:
+            List[bool]: The validation result for each OIB, aligned with the input.
+        """
+        if not data or (_oibfast is None and np is None):
+            return [cls.check(oib) for oib in data]
+        
+        # Fast path for the common case of a list of 11-character strings: pack
+        # them with a single join, with no per-OIB Python work. join() itself
+        # rejects non-str items, and non-ASCII characters become '?', which
+        # keeps the length and fails the digit check
+        strings = cast(List[str], data)
+        try:
+            joined: Optional[str] = "".join(strings)
+        except TypeError:
+            joined = None
+        if joined is not None and set(map(len, strings)) == {cls.LENGTH}:
+            buffer = joined.encode("ascii", "replace")
+            valid = _validate_buffer(buffer, len(data))
+            known_set = cls._known_set
+            if known_set is None:
+                return valid
             
-            # The OIB is valid if the calculated check digit matches the 11th digit
-            return check_digit == int(data_str[10])
+            # Only OIBs with a correct check digit need probing the known set
+            return [is_valid and _in_bloom(known_set, oib) for oib, is_valid in zip(strings, valid)]
         
-        # If we got here, validation failed (not all digits or wrong length)
-        return False
+        # General path for mixed types or lengths: encode every OIB to ASCII bytes
+        encoded: List[bytes] = [_to_ascii(oib) for oib in data]
+        
+        # Only inputs of the right length can be packed into the buffer
+        rows: List[int] = [i for i, oib in enumerate(encoded) if len(oib) == cls.LENGTH]
+        results: List[bool] = [False] * len(data)
+        if not rows:
+            return results
+        
+        buffer = b"".join([encoded[i] for i in rows])
+        known_set = cls._known_set
+        for i, is_valid in zip(rows, _validate_buffer(buffer, len(rows))):
+            # Only OIBs with a correct check digit need probing the known set
+            results[i] = is_valid and (known_set is None or _in_bloom(known_set, encoded[i].decode("ascii")))
+        return results
 
 
 def validate_oib(data: Union[OibType, List[OibType]]) -> Union[bool, Dict[str, bool]]:
@@ -124,7 +595,7 @@ def validate_oib(data: Union[OibType, List[OibType]]) -> Union[bool, Dict[str, b
     for users who don't need to interact with the class directly.
     
     Args:
-        data: A single OIB as string or integer, or a list of OIBs
+        data: A single OIB as string, integer or bytes, or a list of OIBs
              to validate.
     
     Returns:
@@ -143,12 +614,44 @@ def validate_oib(data: Union[OibType, List[OibType]]) -> Union[bool, Dict[str, b
     return OibValidator.validate(data)
 
 
+def _validate_stream(stream: TextIO, out: TextIO, batch_size: int = 4096) -> None:
+    """
+    Validates OIBs read one per line from a stream, writing one result per line.
+    
+    Lines are validated in batches through OibValidator.validate_many() and each
+    batch is written with a single write() call, which avoids the per-line
+    prompt and flush overhead of input()/print() on large piped files.
+    Blank lines are skipped.
+    
+    Args:
+        stream: Text stream to read OIBs from.
+        out: Text stream to write the results to.
+        batch_size: Number of lines to validate per batch.
+    
+    Returns:
+        None
+    """
+    lines = (line.strip() for line in stream)
+    oibs = (line for line in lines if line)
+    while True:
+        # Only one batch is held in memory at a time
+        batch = list(islice(oibs, batch_size))
+        if not batch:
+            break
+        results = OibValidator.validate_many(batch)
+        out.write("".join(
+            f"OIB {oib}: {'Valid' if is_valid else 'Invalid'}\n"
+            for oib, is_valid in zip(batch, results)
+        ))
+
+
 def main() -> None:
     """
     Main entry point for command-line usage.
     
     Provides a simple command-line interface for validating OIB numbers either
-    through command-line arguments or an interactive prompt.
+    through command-line arguments, one OIB per line piped into standard input,
+    or an interactive prompt.
     
     Returns:
         None
@@ -161,6 +664,9 @@ def main() -> None:
         for oib in sys.argv[1:]:
             result = validate_oib(oib)
             print(f"OIB {oib}: {'Valid' if result else 'Invalid'}")
+    elif sys.stdin is not None and not sys.stdin.isatty():
+        # Input is piped in (e.g. `cat oibs.txt | python -m oib_validator`)
+        _validate_stream(sys.stdin, sys.stdout)
     else:
         # No arguments provided, show usage and example
         print("OIB Validator - Test utility for Croatian Personal ID Numbers")
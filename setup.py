@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -13,9 +13,19 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/GrantWise/oib-validator",
     packages=find_packages(),
+    # Ship the type stub of the C accelerator, which mypy can't introspect
+    package_data={"oib_validator": ["_oibfast.pyi"]},
+    # Optional C accelerator for validate_many(); installation carries on
+    # without it (using the pure-Python/NumPy paths) if it fails to compile
+    ext_modules=[
+        Extension(
+            "oib_validator._oibfast",
+            sources=["oib_validator/_oibfast.c"],
+            optional=True,
+        ),
+    ],
     classifiers=[
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
@@ -26,13 +36,20 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Topic :: Utilities",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     entry_points={
         "console_scripts": [
             "oib-validator=oib_validator.validator:main",
         ],
     },
     extras_require={
+        "fast": [
+            "numpy>=1.17",
+        ],
+        "jit": [
+            "numpy>=1.17",
+            "numba>=0.50",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=3.0.0",
@@ -10,9 +10,22 @@ from unittest.mock import patch, call
 import io
 import sys
 from oib_validator import OibValidator, validate_oib
+from oib_validator import validator, _fast
 from oib_validator.validator import main
 
 
+def reference_check(oib):
+    """Straightforward ISO 7064, MOD 11-10 implementation used as an oracle."""
+    control_value = 10
+    for digit in oib[:10]:
+        control_value = (control_value + int(digit)) % 10
+        if control_value == 0:
+            control_value = 10
+        control_value = (control_value * 2) % 11
+    check_digit = 0 if 11 - control_value == 10 else 11 - control_value
+    return check_digit == int(oib[10])
+
+
 class TestOibValidator(unittest.TestCase):
     """Test case for the OIB Validator."""
 
@@ -37,6 +50,30 @@ class TestOibValidator(unittest.TestCase):
         self.assertFalse(OibValidator.validate(invalid_oib))
         self.assertFalse(validate_oib(invalid_oib))
     
+    def test_int_out_of_range(self):
+        """Test that integers without exactly 11 digits are rejected."""
+        # "03456789012" can't be represented as an int with its leading zero
+        self.assertFalse(OibValidator.check(3456789012))
+        self.assertFalse(OibValidator.check(-12345678903))
+        self.assertFalse(OibValidator.check(123456789030))
+        self.assertFalse(OibValidator.check(True))
+        # Valid OIBs at both ends of the 11-digit integer range
+        self.assertTrue(OibValidator.check(10000000000))
+        self.assertTrue(OibValidator.check(99999999994))
+
+    def test_bytes_input(self):
+        """Test that bytes, bytearray and memoryview OIBs are validated directly."""
+        for oib_type in (bytes, bytearray, lambda b: memoryview(bytes(b))):
+            self.assertTrue(OibValidator.check(oib_type(b"12345678903")))
+            self.assertFalse(OibValidator.check(oib_type(b"12345678901")))
+            self.assertFalse(OibValidator.check(oib_type(b"1234567890")))
+            self.assertFalse(OibValidator.check(oib_type(b"1234567890\xb3")))
+        # Keyed by the decoded OIB, not by the bytes repr "b'12345678903'"
+        self.assertEqual(validate_oib([b"12345678903", bytearray(b"12345678901")]),
+                         {"12345678903": True, "12345678901": False})
+        oibs = [b"12345678903", b"1234567890A", memoryview(b"69435151530")] * OibValidator.BULK_THRESHOLD
+        self.assertEqual(OibValidator.validate_many(oibs), [True, False, True] * OibValidator.BULK_THRESHOLD)
+
     def test_wrong_length(self):
         """Test that an OIB with incorrect length is rejected."""
         # Too short
@@ -54,6 +91,14 @@ class TestOibValidator(unittest.TestCase):
         result = validate_oib(oibs)
         self.assertEqual(result, {"12345678903": True, "12345678901": False})
     
+    def test_list_of_oibs_keys(self):
+        """Test that list results are keyed by string in first-seen order, without duplicates."""
+        oibs = [69435151530, "12345678901", "69435151530", "12345678903"]
+        result = validate_oib(oibs)
+        self.assertEqual(list(result.items()), [
+            ("69435151530", True), ("12345678901", False), ("12345678903", True),
+        ])
+
     def test_algorithm_implementation(self):
         """Test that our algorithm implementation correctly validates OIBs."""
         # Test with manually verified valid OIBs
@@ -103,6 +148,149 @@ class TestOibValidator(unittest.TestCase):
         # The 11th digit of "69435151530" is 0. So it's valid.
         self.assertTrue(OibValidator.check("69435151530")) # Already in test_algorithm_implementation
 
+    def test_matches_reference_algorithm(self):
+        """Test that the table-driven check agrees with the plain algorithm."""
+        for base in range(0, 10 ** 10, 10030091):
+            for check_digit in range(10):
+                oib = f"{base:010d}{check_digit}"
+                self.assertEqual(OibValidator.check(oib), reference_check(oib), oib)
+
+    def test_non_ascii_digits(self):
+        """Test that Unicode digits outside ASCII 0-9 are rejected."""
+        self.assertFalse(OibValidator.check("\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u0660\u0663"))
+        # Devanagari digits, which str.isdigit() accepts and int() would convert
+        self.assertFalse(OibValidator.check("\u0967\u0968\u0969\u096a\u096b\u096c\u096d\u096e\u096f\u0966\u0967"))
+        # Superscript digits pass str.isdigit() but can't even be parsed by int()
+        self.assertFalse(OibValidator.check("1234567890\u00b3"))
+        # Full-width digits mixed into an otherwise valid OIB
+        self.assertFalse(OibValidator.check("\uff11" + "2345678903"))
+        # Surrounding whitespace or a trailing newline is not stripped
+        self.assertFalse(OibValidator.check("12345678903\n"))
+        self.assertFalse(OibValidator.check(" 12345678903"))
+
+    def test_check_cache(self):
+        """Test that repeated checks are served from the cache and can be cleared."""
+        OibValidator.cache_clear()
+        self.assertEqual(validator._check_str.cache_info().currsize, 0)
+        self.assertTrue(OibValidator.check("12345678903"))
+        self.assertTrue(OibValidator.check(12345678903))
+        self.assertFalse(OibValidator.check("1234567890A"))
+        info = validator._check_str.cache_info()
+        self.assertEqual((info.hits, info.currsize), (1, 1))
+        OibValidator.cache_clear()
+        self.assertEqual(validator._check_str.cache_info().currsize, 0)
+
+    def test_known_set(self):
+        """Test that a registered known set rejects valid OIBs outside it."""
+        self.addCleanup(OibValidator.with_known_set, None)
+        known = ["12345678903", 10000000018]
+        # A tiny false positive rate keeps the outcome for unknown OIBs deterministic
+        self.assertIs(OibValidator.with_known_set(known, false_positive_rate=1e-9), OibValidator)
+        self.assertTrue(OibValidator.check("12345678903"))
+        self.assertTrue(OibValidator.check("10000000018"))
+        self.assertFalse(OibValidator.check("69435151530"))
+        self.assertFalse(OibValidator.check("12345678901"))
+        oibs = ["12345678903", "69435151530", 10000000018, "bad"] * OibValidator.BULK_THRESHOLD
+        self.assertEqual(OibValidator.validate_many(oibs), [True, False, True, False] * OibValidator.BULK_THRESHOLD)
+        # No false negatives: the early-exit probe agrees with the positions set
+        # for every registered OIB
+        many = [f"{n:011d}" for n in range(0, 10 ** 11, 99999989)]
+        OibValidator.with_known_set(many)
+        self.assertTrue(all(validator._in_bloom(OibValidator._known_set, oib) for oib in many))
+        # Removing the known set restores plain validation
+        OibValidator.with_known_set(None)
+        self.assertTrue(OibValidator.check("69435151530"))
+        with self.assertRaises(ValueError):
+            OibValidator.with_known_set(known, false_positive_rate=0)
+
+    def test_validate_many(self):
+        """Test that bulk validation matches check() and preserves input order."""
+        oibs = [
+            "12345678903", "12345678901", 69435151530, "1234567890",
+            "1234567890A", "\u0661\u0662\u0663\u0664\u0665\u0666\u0667\u0668\u0669\u0660\u0663",
+            "", 12345678903, "-1234567890",
+        ] + [f"{n:011d}" for n in range(0, 10 ** 11, 999999937)]
+        expected = [OibValidator.check(oib) for oib in oibs]
+        self.assertEqual(OibValidator.validate_many(oibs), expected)
+        self.assertEqual(OibValidator.validate_many([]), [])
+        # All-digit batches take the whole-buffer fast path of the digit check
+        self.assertEqual(OibValidator.validate_many(oibs[9:]), expected[9:])
+        # Lists of 11-character strings take the single-join packing path,
+        # including ones with non-digit and non-ASCII characters
+        strings = [oib for oib in oibs if isinstance(oib, str) and len(oib) == 11]
+        self.assertEqual(OibValidator.validate_many(strings),
+                         [OibValidator.check(oib) for oib in strings])
+        # Every backend has to agree: C extension, Numba, NumPy and pure Python
+        with patch.object(validator, '_oibfast', None):
+            self.assertEqual(OibValidator.validate_many(oibs), expected)
+            with patch.object(_fast, 'PARALLEL_MIN_ROWS', 1):
+                self.assertEqual(OibValidator.validate_many(oibs), expected)
+            with patch.object(_fast, 'HAVE_NUMBA', False):
+                self.assertEqual(OibValidator.validate_many(oibs), expected)
+            with patch.object(validator, 'np', None):
+                self.assertEqual(OibValidator.validate_many(oibs), expected)
+
+    @unittest.skipIf(validator._oibfast is None, "C extension is not built")
+    def test_c_extension(self):
+        """Test the C extension against the reference algorithm."""
+        oibs = [f"{n:011d}" for n in range(0, 10 ** 11, 99999989)]
+        expected = [reference_check(oib) for oib in oibs]
+        # Rows padded to 16 bytes, as well as tightly packed 11-byte rows
+        padded = b"".join(oib.encode("ascii") + b"\0" * 5 for oib in oibs)
+        self.assertEqual(list(map(bool, validator._oibfast.validate_many(padded, 16, len(oibs)))), expected)
+        packed = "".join(oibs).encode("ascii")
+        self.assertEqual(list(map(bool, validator._oibfast.validate_many(packed, 11, len(oibs)))), expected)
+        # Non-digit bytes, including ones above 0x7F, are rejected
+        self.assertEqual(validator._oibfast.validate_many(b"1234567890\xb31234567890/", 11, 2), b"\0\0")
+        with self.assertRaises(ValueError):
+            validator._oibfast.validate_many(packed, 11, len(oibs) + 1)
+        # Large batches are split into per-CPU chunks validated on threads,
+        # with uneven chunk sizes when the row count doesn't divide evenly
+        with patch.object(validator, '_PARALLEL_MIN_ROWS', 7), \
+                patch.object(validator, '_available_cpus', return_value=4):
+            for count in (6, 7, 22, len(oibs)):
+                self.assertEqual(OibValidator.validate_many(oibs[:count]), expected[:count])
+
+    @unittest.skipUnless(_fast.HAVE_NUMBA, "Numba is not installed")
+    def test_numba_kernels(self):
+        """Test the compiled kernels against the reference algorithm."""
+        import numpy as np
+        oibs = [f"{n:011d}" for n in range(0, 10 ** 11, 99999989)]
+        matrix = np.frombuffer("".join(oibs).encode("ascii"), dtype=np.uint8).reshape(-1, 11) - 48
+        expected = [reference_check(oib) for oib in oibs]
+        self.assertEqual([bool(_fast.check_digits(row)) for row in matrix], expected)
+        self.assertEqual(_fast.check_rows(matrix).tolist(), expected)
+        self.assertEqual(_fast.check_rows_parallel(matrix).tolist(), expected)
+        self.assertEqual(_fast.compile_fixed_kernel(len(matrix))(matrix).tolist(), expected)
+
+    @unittest.skipUnless(_fast.HAVE_NUMBA, "Numba is not installed")
+    def test_numba_kernel_selection(self):
+        """Test that check_matrix() specializes only for repeated batch sizes."""
+        import numpy as np
+        matrix = np.zeros((4, 11), dtype=np.uint8)
+        with patch.object(_fast, 'FIXED_MIN_ROWS', 4), patch.object(_fast, 'FIXED_AFTER_REPEATS', 3), \
+                patch.object(_fast, 'compile_fixed_kernel', wraps=_fast.compile_fixed_kernel) as compile_kernel:
+            _fast.check_matrix(matrix[:3])
+            _fast.check_matrix(matrix)
+            _fast.check_matrix(matrix)
+            compile_kernel.assert_not_called()
+            self.assertEqual(_fast.check_matrix(matrix).tolist(), [False] * 4)
+            compile_kernel.assert_called_once_with(4)
+
+    def test_validate_all(self):
+        """Test that list-aligned validation keeps order and duplicates."""
+        oibs = ["12345678903", "12345678901", "12345678903", 69435151530]
+        self.assertEqual(OibValidator.validate_all(oibs), [True, False, True, True])
+        self.assertEqual(OibValidator.validate_all([]), [])
+        large = oibs * OibValidator.BULK_THRESHOLD
+        self.assertEqual(OibValidator.validate_all(large), [True, False, True, True] * OibValidator.BULK_THRESHOLD)
+
+    def test_large_list_of_oibs(self):
+        """Test that lists above the bulk threshold give the same dictionary."""
+        oibs = ["12345678903", "12345678901"] * OibValidator.BULK_THRESHOLD + ["69435151530"]
+        result = validate_oib(oibs)
+        self.assertEqual(result, {"12345678903": True, "12345678901": False, "69435151530": True})
+
     @patch('sys.stdout', new_callable=io.StringIO)
     @patch('sys.argv', ['oib_validator/validator.py', '12345678903', '12345678901'])
     def test_main_with_args(self, mock_stdout):
@@ -112,9 +300,29 @@ class TestOibValidator(unittest.TestCase):
         self.assertEqual(mock_stdout.getvalue(), expected_output)
 
     @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stdin', new_callable=io.StringIO, initial_value="12345678903\n\n 12345678901 \n69435151530")
+    @patch('sys.argv', ['oib_validator/validator.py'])
+    def test_main_piped_input(self, mock_stdin, mock_stdout):
+        """Test main function with OIBs piped into standard input."""
+        main()
+        expected_output = "OIB 12345678903: Valid\nOIB 12345678901: Invalid\nOIB 69435151530: Valid\n"
+        self.assertEqual(mock_stdout.getvalue(), expected_output)
+
+    def test_validate_stream_batches(self):
+        """Test that streamed validation gives the same output across batch boundaries."""
+        oibs = ["12345678903", "12345678901", "69435151530", "bad"] * 5
+        out = io.StringIO()
+        validator._validate_stream(io.StringIO("\n".join(oibs)), out, batch_size=3)
+        expected = "".join(
+            f"OIB {oib}: {'Valid' if OibValidator.check(oib) else 'Invalid'}\n" for oib in oibs
+        )
+        self.assertEqual(out.getvalue(), expected)
+
+    @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stdin', **{'isatty.return_value': True})  # Interactive mode needs a terminal
     @patch('builtins.input', side_effect=['exit']) # Add mock for input
     @patch('sys.argv', ['oib_validator/validator.py'])
-    def test_main_no_args(self, mock_input, mock_stdout): # Add mock_input
+    def test_main_no_args(self, mock_input, mock_stdin, mock_stdout): # Add mock_input
         """Test main function with no command-line arguments."""
         main()
         output = mock_stdout.getvalue()
@@ -128,10 +336,11 @@ class TestOibValidator(unittest.TestCase):
 
 
     @patch('sys.stdout', new_callable=io.StringIO)
+    @patch('sys.stdin', **{'isatty.return_value': True})  # Interactive mode needs a terminal
     @patch('builtins.input', side_effect=['12345678903', '12345678901', 'exit'])
     # No need to patch sys.argv here if main() is called with no args, it will enter interactive mode.
     # Patching sys.argv to ['oib_validator/validator.py'] is effectively the same as no args for this path.
-    def test_main_interactive_mode(self, mock_input, mock_stdout):
+    def test_main_interactive_mode(self, mock_input, mock_stdin, mock_stdout):
         """Test main function in interactive mode."""
         # To isolate interactive mode, we ensure sys.argv implies no direct OIBs
         with patch('sys.argv', ['oib_validator/validator.py']):